@@ -2,16 +2,30 @@ import asyncio
 import json
 import logging
 import time
+from collections import deque
 from datetime import datetime
+from math import exp, sqrt
 from typing import Dict, List, Tuple, Optional
 
 import numpy as np
-import pandas as pd
 import websockets
-from scipy import stats
 import PySimpleGUI as sg
 from PySimpleGUI import Window
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        def wrapper(func):
+            return func
+        return wrapper
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("trade_simulator")
 
@@ -34,100 +48,170 @@ MAX_ORDERBOOK_LEVELS = 50
 UPDATE_INTERVAL_MS = 100
 MAX_HISTORY_SIZE = 300
 
+# (maker, taker) fee rates per tier, frozen at import time
+_FEE_TABLES = {
+    "OKX": {
+        "vip0": (0.0008, 0.0010),
+        "vip1": (0.0007, 0.0009),
+        "vip2": (0.0006, 0.0008),
+        "vip3": (0.0005, 0.0007),
+        "vip4": (0.0003, 0.0005),
+        "vip5": (0.0000, 0.0003),
+    },
+    "Binance": {
+        "vip0": (0.0010, 0.0010),
+        "vip1": (0.0008, 0.0010),
+        "vip2": (0.0006, 0.0008),
+        "vip3": (0.0004, 0.0006),
+        "vip4": (0.0002, 0.0004),
+        "vip5": (0.0000, 0.0002),
+    }
+}
+
+
+@njit(cache=True)
+def _walk_book(prices, quantities, usd_amount):
+    consumed = 0.0
+    executed_quantity = 0.0
+    total_cost = 0.0
+
+    for i in range(prices.shape[0]):
+        level_volume = prices[i] * quantities[i]
+        take_volume = min(usd_amount - consumed, level_volume)
+        if take_volume <= 0:
+            break
+        total_cost += take_volume
+        executed_quantity += take_volume / prices[i]
+        consumed += take_volume
+
+    avg_price = total_cost / executed_quantity if executed_quantity > 0 else 0.0
+    return avg_price, executed_quantity
+
+
+# Warm up the JIT so the first real tick doesn't pay compile latency
+_walk_book(np.array([1.0]), np.array([1.0]), 1.0)
+
+
 class OrderBook:
     def __init__(self):
-        self.asks = []
-        self.bids = []
-        self.timestamp = None
+        self.asks_arr = np.empty((0, 2), dtype=np.float64)
+        self.bids_arr = np.empty((0, 2), dtype=np.float64)
+        self._timestamp_raw = None
+        self._timestamp_parsed = None
         self.symbol = ""
         self.exchange = ""
-        self.last_update_time = time.time()
-        self.price_history = []
-        self.spread_history = []
-        self.mid_price_history = []
-        self.volume_history = []
+        self.last_update_ns = time.monotonic_ns()
+        self.last_mid_price = 0.0
+        self._time_buf = np.empty(MAX_HISTORY_SIZE, dtype=np.int64)
+        self._mid_buf = np.empty(MAX_HISTORY_SIZE, dtype=np.float64)
+        self._spread_buf = np.empty(MAX_HISTORY_SIZE, dtype=np.float64)
+        self._vol_buf = np.empty(MAX_HISTORY_SIZE, dtype=np.float64)
+        self._head = 0
+        self._count = 0
+        self._dirty = False
         
     def update(self, data: Dict):
-        self.timestamp = datetime.fromisoformat(data["timestamp"].replace("Z", "+00:00"))
+        self._timestamp_raw = data["timestamp"]
+        self._timestamp_parsed = None
         self.symbol = data["symbol"]
         self.exchange = data["exchange"]
         
-        self.asks = [(float(price), float(qty)) for price, qty in data["asks"][:MAX_ORDERBOOK_LEVELS]]
-        self.bids = [(float(price), float(qty)) for price, qty in data["bids"][:MAX_ORDERBOOK_LEVELS]]
-        
-        self.asks.sort(key=lambda x: x[0])
-        self.bids.sort(key=lambda x: x[0], reverse=True)
-        
-        current_time = time.time()
-        self.last_update_time = current_time
-        
-        if self.asks and self.bids:
-            best_ask = self.asks[0][0]
-            best_bid = self.bids[0][0]
+        asks = np.asarray(data["asks"][:MAX_ORDERBOOK_LEVELS], dtype=np.float64).reshape(-1, 2)
+        bids = np.asarray(data["bids"][:MAX_ORDERBOOK_LEVELS], dtype=np.float64).reshape(-1, 2)
+
+        # The feed delivers sorted levels; only fall back to a sort if that invariant breaks
+        if asks.size and not np.all(np.diff(asks[:, 0]) >= 0):
+            asks = asks[np.argsort(asks[:, 0])]
+        if bids.size and not np.all(np.diff(bids[:, 0]) <= 0):
+            bids = bids[np.argsort(bids[:, 0])[::-1]]
+
+        self.asks_arr = asks
+        self.bids_arr = bids
+
+        current_ns = time.monotonic_ns()
+        self.last_update_ns = current_ns
+
+        if asks.size and bids.size:
+            best_ask = asks[0, 0]
+            best_bid = bids[0, 0]
             mid_price = (best_ask + best_bid) / 2
             spread = best_ask - best_bid
-            
-            self.price_history.append((current_time, mid_price))
-            self.spread_history.append((current_time, spread))
-            self.mid_price_history.append(mid_price)
-            
+            self.last_mid_price = mid_price
+
             threshold = mid_price * 0.001
-            near_ask_volume = sum(qty for price, qty in self.asks if price <= mid_price + threshold)
-            near_bid_volume = sum(qty for price, qty in self.bids if price >= mid_price - threshold)
-            self.volume_history.append((current_time, near_ask_volume + near_bid_volume))
-            
-            if len(self.price_history) > MAX_HISTORY_SIZE:
-                self.price_history = self.price_history[-MAX_HISTORY_SIZE:]
-                self.spread_history = self.spread_history[-MAX_HISTORY_SIZE:]
-                self.mid_price_history = self.mid_price_history[-MAX_HISTORY_SIZE:]
-                self.volume_history = self.volume_history[-MAX_HISTORY_SIZE:]
+            near_ask_volume = float(asks[:, 1][asks[:, 0] <= mid_price + threshold].sum())
+            near_bid_volume = float(bids[:, 1][bids[:, 0] >= mid_price - threshold].sum())
+
+            i = self._head
+            self._time_buf[i] = current_ns
+            self._mid_buf[i] = mid_price
+            self._spread_buf[i] = spread
+            self._vol_buf[i] = near_ask_volume + near_bid_volume
+            self._head = (i + 1) % MAX_HISTORY_SIZE
+            self._count = min(self._count + 1, MAX_HISTORY_SIZE)
+
+        self._dirty = True
     
+    @property
+    def timestamp(self) -> Optional[datetime]:
+        if self._timestamp_parsed is None and self._timestamp_raw is not None:
+            self._timestamp_parsed = datetime.fromisoformat(self._timestamp_raw.replace("Z", "+00:00"))
+        return self._timestamp_parsed
+
+    def recent_history(self, buf: np.ndarray, n: int) -> np.ndarray:
+        n = min(n, self._count)
+        start = (self._head - n) % MAX_HISTORY_SIZE
+        if start + n <= MAX_HISTORY_SIZE:
+            return buf[start:start + n]
+        return np.concatenate((buf[start:], buf[:start + n - MAX_HISTORY_SIZE]))
+
+    @property
+    def asks(self) -> List[Tuple[float, float]]:
+        return list(zip(self.asks_arr[:, 0], self.asks_arr[:, 1]))
+
+    @property
+    def bids(self) -> List[Tuple[float, float]]:
+        return list(zip(self.bids_arr[:, 0], self.bids_arr[:, 1]))
+
     def get_liquidity_at_level(self, usd_amount: float, side: str = "buy") -> Tuple[float, float]:
-        if not self.asks or not self.bids:
+        if not self.asks_arr.size or not self.bids_arr.size:
             return 0.0, 0.0
             
-        levels = self.asks if side.lower() == "buy" else self.bids
-        remaining_amount = usd_amount
-        executed_quantity = 0.0
-        total_cost = 0.0
-        
-        for price, quantity in levels:
-            level_volume = price * quantity
-            if remaining_amount <= 0:
-                break
-                
-            take_volume = min(remaining_amount, level_volume)
-            take_quantity = take_volume / price
-            
-            total_cost += take_quantity * price
-            executed_quantity += take_quantity
-            remaining_amount -= take_volume
-        
-        avg_price = total_cost / executed_quantity if executed_quantity > 0 else 0
-        return avg_price, executed_quantity
+        levels = self.asks_arr if side.lower() == "buy" else self.bids_arr
+        return _walk_book(np.ascontiguousarray(levels[:, 0]),
+                          np.ascontiguousarray(levels[:, 1]),
+                          usd_amount)
     
     def calculate_price_volatility(self, window_size=20):
-        if len(self.mid_price_history) < window_size:
+        if self._count < window_size:
             return 0.01  # Default value if not enough data
-            
-        recent_prices = self.mid_price_history[-window_size:]
-        returns = [np.log(recent_prices[i] / recent_prices[i-1]) for i in range(1, len(recent_prices))]
-        
-        if not returns:
+
+        recent_prices = self.recent_history(self._mid_buf, window_size)
+        returns = np.diff(np.log(recent_prices))
+
+        if not returns.size:
             return 0.01
-            
+
         volatility = np.std(returns) * np.sqrt(86400)  # Annualized
         return volatility if not np.isnan(volatility) else 0.01
 
 
 class MarketImpactCalculator:
+    # Impact horizon: one second expressed in days
+    _SQRT_T = sqrt(1/86400)
+
     def __init__(self, orderbook: OrderBook):
         self.orderbook = orderbook
         self.volatility = 0.0
-        
+        self._sigma_sqrt_t = 0.02 * self._SQRT_T
+
     def update_volatility(self, volatility: float):
+        # Volatility only changes on Apply or once per tick, so fold
+        # sigma * sqrt(T) here instead of recomputing per UI refresh
         self.volatility = volatility
-        
+        sigma = volatility if volatility > 0 else 0.02
+        self._sigma_sqrt_t = sigma * self._SQRT_T
+
     def calculate_slippage(self, quantity: float, side: str = "buy") -> float:
         if not self.orderbook.asks or not self.orderbook.bids:
             return 0.0
@@ -142,23 +226,19 @@ class MarketImpactCalculator:
         return slippage_pct
     
     def calculate_market_impact(self, quantity: float, side: str = "buy", market_cap: float = 1e10) -> float:
-        if not self.orderbook.mid_price_history:
+        if not self.orderbook._count:
             return 0.0
-            
-        mid_price = self.orderbook.mid_price_history[-1]
-        
-        if len(self.orderbook.volume_history) > 10:
-            recent_volumes = [vol for _, vol in self.orderbook.volume_history[-10:]]
-            avg_tick_volume = sum(recent_volumes) / len(recent_volumes)
+
+        mid_price = self.orderbook.last_mid_price
+
+        if self.orderbook._count > 10:
+            recent_volumes = self.orderbook.recent_history(self.orderbook._vol_buf, 10)
+            avg_tick_volume = float(recent_volumes.mean())
             daily_volume_estimate = avg_tick_volume * 86400
         else:
             daily_volume_estimate = market_cap * 0.05
         
-        sigma = self.volatility if self.volatility > 0 else 0.02
-        T = 1/86400
-        
-        quantity_in_usd = quantity
-        impact_factor = sigma * np.sqrt(T) * np.sqrt(quantity_in_usd / daily_volume_estimate)
+        impact_factor = self._sigma_sqrt_t * sqrt(quantity / daily_volume_estimate)
         impact_pct = impact_factor * 100
         
         return impact_pct
@@ -172,37 +252,18 @@ class MarketImpactCalculator:
         best_bid_size = self.orderbook.bids[0][1] * self.orderbook.bids[0][0]
         
         relative_size = (best_ask_size + best_bid_size) / (2 * quantity)
-        
-        taker_pct = 100 / (1 + np.exp(relative_size - 1))
+
+        # Clamp so math.exp never overflows for tiny order sizes
+        taker_pct = 100 / (1 + exp(min(relative_size - 1, 700.0)))
         maker_pct = 100 - taker_pct
         
         return maker_pct, taker_pct
     
     def calculate_fees(self, quantity: float, fee_tier: str = "vip0") -> float:
-        fee_structures = {
-            "OKX": {
-                "vip0": {"maker": 0.0008, "taker": 0.0010},
-                "vip1": {"maker": 0.0007, "taker": 0.0009},
-                "vip2": {"maker": 0.0006, "taker": 0.0008},
-                "vip3": {"maker": 0.0005, "taker": 0.0007},
-                "vip4": {"maker": 0.0003, "taker": 0.0005},
-                "vip5": {"maker": 0.0000, "taker": 0.0003},
-            },
-            "Binance": {
-                "vip0": {"maker": 0.0010, "taker": 0.0010},
-                "vip1": {"maker": 0.0008, "taker": 0.0010},
-                "vip2": {"maker": 0.0006, "taker": 0.0008},
-                "vip3": {"maker": 0.0004, "taker": 0.0006},
-                "vip4": {"maker": 0.0002, "taker": 0.0004},
-                "vip5": {"maker": 0.0000, "taker": 0.0002},
-            }
-        }
-        
-        exchange = self.orderbook.exchange if self.orderbook.exchange in fee_structures else "OKX"
-        tier_fees = fee_structures[exchange].get(fee_tier.lower(), fee_structures[exchange]["vip0"])
-        maker_fee = tier_fees["maker"]
-        taker_fee = tier_fees["taker"]
-        
+        exchange = self.orderbook.exchange if self.orderbook.exchange in _FEE_TABLES else "OKX"
+        tier_table = _FEE_TABLES[exchange]
+        maker_fee, taker_fee = tier_table.get(fee_tier.lower(), tier_table["vip0"])
+
         maker_pct, taker_pct = self.estimate_maker_taker_proportion(quantity)
         
         weighted_fee_rate = (maker_pct/100 * maker_fee) + (taker_pct/100 * taker_fee)
@@ -211,14 +272,57 @@ class MarketImpactCalculator:
         return fee_pct
     
     def get_net_cost(self, quantity: float, fee_tier: str = "vip0", side: str = "buy") -> Dict:
-        slippage_pct = self.calculate_slippage(quantity, side)
-        fee_pct = self.calculate_fees(quantity, fee_tier)
-        market_impact_pct = self.calculate_market_impact(quantity, side)
-        
-        maker_pct, taker_pct = self.estimate_maker_taker_proportion(quantity)
-        
+        orderbook = self.orderbook
+        asks = orderbook.asks_arr
+        bids = orderbook.bids_arr
+
+        if not asks.size or not bids.size:
+            return {
+                "slippage_pct": 0.0,
+                "fee_pct": 0.0,
+                "market_impact_pct": 0.0,
+                "maker_pct": 0.0,
+                "taker_pct": 100.0,
+                "net_cost_pct": 0.0
+            }
+
+        best_ask = asks[0, 0]
+        best_bid = bids[0, 0]
+        mid_price = (best_ask + best_bid) / 2
+
+        # Slippage: walk the book once
+        levels = asks if side.lower() == "buy" else bids
+        expected_price, _ = _walk_book(np.ascontiguousarray(levels[:, 0]),
+                                       np.ascontiguousarray(levels[:, 1]),
+                                       quantity)
+        if expected_price > 0:
+            slippage_pct = ((expected_price / mid_price) - 1) * 100 if side == "buy" else ((mid_price / expected_price) - 1) * 100
+        else:
+            slippage_pct = 0.0
+
+        # Maker/taker split: evaluate the logistic once and reuse it for fees
+        best_ask_size = asks[0, 1] * best_ask
+        best_bid_size = bids[0, 1] * best_bid
+        relative_size = (best_ask_size + best_bid_size) / (2 * quantity)
+        taker_pct = 100 / (1 + exp(min(relative_size - 1, 700.0)))
+        maker_pct = 100 - taker_pct
+
+        exchange = orderbook.exchange if orderbook.exchange in _FEE_TABLES else "OKX"
+        tier_table = _FEE_TABLES[exchange]
+        maker_fee, taker_fee = tier_table.get(fee_tier.lower(), tier_table["vip0"])
+        fee_pct = ((maker_pct / 100 * maker_fee) + (taker_pct / 100 * taker_fee)) * 100
+
+        # Market impact from the same snapshot
+        if orderbook._count > 10:
+            avg_tick_volume = float(orderbook.recent_history(orderbook._vol_buf, 10).mean())
+            daily_volume_estimate = avg_tick_volume * 86400
+        else:
+            daily_volume_estimate = 1e10 * 0.05
+
+        market_impact_pct = self._sigma_sqrt_t * sqrt(quantity / daily_volume_estimate) * 100
+
         net_cost_pct = slippage_pct + fee_pct + market_impact_pct
-        
+
         return {
             "slippage_pct": slippage_pct,
             "fee_pct": fee_pct,
@@ -242,8 +346,11 @@ class TradeSimulator:
         self.fee_tier = "vip0"
         self.websocket_url = WEBSOCKET_ENDPOINTS["OKX"]["BTC-USDT-SWAP"]
         
-        self.process_times = []
-        self.last_tick_time = time.time()
+        self.process_times = deque(maxlen=100)
+        self.last_tick_ns = time.monotonic_ns()
+        self._raw_q = asyncio.Queue(maxsize=1024)
+        self.tick_event = asyncio.Event()
+        self.frames_coalesced = 0
         
     def update_symbol_and_exchange(self, exchange, symbol):
         if exchange in WEBSOCKET_ENDPOINTS and symbol in WEBSOCKET_ENDPOINTS[exchange]:
@@ -257,61 +364,97 @@ class TradeSimulator:
         max_retries = 5
         retry_delay = 2
         retry_count = 0
-        
-        while self.running and retry_count < max_retries:
+
+        processor_task = asyncio.create_task(self._process_messages())
+        try:
+            while self.running and retry_count < max_retries:
+                try:
+                    logger.info(f"Connecting to {self.websocket_url}")
+                    async with websockets.connect(self.websocket_url) as websocket:
+                        retry_count = 0
+                        await self._read_messages(websocket)
+                except Exception as e:
+                    retry_count += 1
+                    logger.error(f"Connection attempt {retry_count} failed: {e}")
+                    if retry_count < max_retries:
+                        await asyncio.sleep(retry_delay)
+                    else:
+                        logger.error("Max retries reached. Stopping connection attempts.")
+                        break
+        finally:
+            processor_task.cancel()
+            try:
+                await processor_task
+            except asyncio.CancelledError:
+                pass
+
+    async def _read_messages(self, websocket):
+        # Keep the socket read hot: only recv and enqueue here. Under
+        # backpressure drop the oldest frame - L2 snapshots supersede each other.
+        while self.running:
+            try:
+                response = await websocket.recv()
+            except websockets.exceptions.ConnectionClosed:
+                logger.error("WebSocket connection closed")
+                break
+
+            if self._raw_q.full():
+                try:
+                    self._raw_q.get_nowait()
+                except asyncio.QueueEmpty:
+                    pass
+            self._raw_q.put_nowait(response)
+
+    async def _process_messages(self):
+        while self.running:
             try:
-                logger.info(f"Connecting to {self.websocket_url}")
-                async with websockets.connect(self.websocket_url) as websocket:
-                    retry_count = 0
-                    while self.running:
-                        try:
-                            start_time = time.time()
-                            self.last_tick_time = start_time
-                            
-                            response = await websocket.recv()
-                            data = json.loads(response)
-                            
-                            self.orderbook.update(data)
-                            
-                            # Update volatility from orderbook data or from user input
-                            calculated_volatility = self.orderbook.calculate_price_volatility()
-                            self.volatility = max(calculated_volatility, self.volatility)
-                            self.market_impact_calculator.update_volatility(self.volatility)
-                            
-                            end_time = time.time()
-                            process_time = (end_time - start_time) * 1000
-                            self.process_times.append(process_time)
-                            
-                            if len(self.process_times) > 100:
-                                self.process_times = self.process_times[-100:]
-                                
-                        except websockets.exceptions.ConnectionClosed:
-                            logger.error("WebSocket connection closed")
-                            break
-                        except json.JSONDecodeError as e:
-                            logger.error(f"JSON decode error: {e}")
-                            continue
-                        except Exception as e:
-                            logger.error(f"Error processing data: {e}")
-                            await asyncio.sleep(1)
-                            
+                response = await self._raw_q.get()
+
+                # Drain any backlog and process only the newest frame - each
+                # L2 snapshot supersedes the ones queued before it
+                while True:
+                    try:
+                        response = self._raw_q.get_nowait()
+                        self.frames_coalesced += 1
+                    except asyncio.QueueEmpty:
+                        break
+
+                start_ns = time.monotonic_ns()
+                self.last_tick_ns = start_ns
+
+                data = _json_loads(response)
+                self.orderbook.update(data)
+
+                # Update volatility from orderbook data or from user input
+                calculated_volatility = self.orderbook.calculate_price_volatility()
+                self.volatility = max(calculated_volatility, self.volatility)
+                self.market_impact_calculator.update_volatility(self.volatility)
+
+                process_time = (time.monotonic_ns() - start_ns) / 1e6
+                self.process_times.append(process_time)
+
+                self.tick_event.set()
+
+            except asyncio.CancelledError:
+                raise
+            except json.JSONDecodeError as e:
+                logger.error(f"JSON decode error: {e}")
+                continue
             except Exception as e:
-                retry_count += 1
-                logger.error(f"Connection attempt {retry_count} failed: {e}")
-                if retry_count < max_retries:
-                    await asyncio.sleep(retry_delay)
-                else:
-                    logger.error("Max retries reached. Stopping connection attempts.")
-                    break
-    
+                logger.error(f"Error processing data: {e}")
+                await asyncio.sleep(1)
+
     def get_performance_metrics(self) -> Dict:
         if not self.process_times:
-            return {"avg_latency": 0, "max_latency": 0, "min_latency": 0}
-            
+            return {"avg_latency": 0, "max_latency": 0, "min_latency": 0,
+                    "queue_depth": self._raw_q.qsize(), "frames_coalesced": self.frames_coalesced}
+
         return {
             "avg_latency": sum(self.process_times) / len(self.process_times),
             "max_latency": max(self.process_times),
-            "min_latency": min(self.process_times)
+            "min_latency": min(self.process_times),
+            "queue_depth": self._raw_q.qsize(),
+            "frames_coalesced": self.frames_coalesced
         }
     
     def get_simulation_results(self) -> Dict:
@@ -327,6 +470,13 @@ class TradeSimulator:
         return results
 
 
+UI_TEXT_KEYS = (
+    "-BEST_BID-", "-BEST_ASK-", "-SPREAD-", "-CALC_VOLATILITY-", "-LAST_UPDATE-", "-STATUS-",
+    "-SLIPPAGE-", "-FEES-", "-MARKET_IMPACT-", "-NET_COST-", "-MAKER-", "-TAKER-",
+    "-AVG_LATENCY-", "-MAX_LATENCY-", "-MIN_LATENCY-"
+)
+
+
 def create_layout():
     # Get available exchanges and symbols
     exchanges = list(WEBSOCKET_ENDPOINTS.keys())
@@ -390,39 +540,71 @@ def create_layout():
 
 
 async def update_ui(window, simulator):
+    # Resolve widget references once; the key set is fixed at startup
+    widget_refs = {key: window[key] for key in UI_TEXT_KEYS}
+    last_display = {}
+
     while simulator.running:
         try:
-            if simulator.orderbook.asks and simulator.orderbook.bids:
-                best_ask = simulator.orderbook.asks[0][0]
-                best_bid = simulator.orderbook.bids[0][0]
+            # Format everything first, then push changed strings to Tk in
+            # one tight loop and flush with a single refresh
+            updates = {}
+
+            if simulator.orderbook.asks_arr.size and simulator.orderbook.bids_arr.size:
+                best_ask = simulator.orderbook.asks_arr[0, 0]
+                best_bid = simulator.orderbook.bids_arr[0, 0]
                 spread_pct = (best_ask - best_bid) / best_bid * 100
-                
-                window["-BEST_BID-"].update(f"{best_bid:.2f}")
-                window["-BEST_ASK-"].update(f"{best_ask:.2f}")
-                window["-SPREAD-"].update(f"{spread_pct:.4f}%")
-                window["-CALC_VOLATILITY-"].update(f"{simulator.volatility * 100:.4f}%")
-                
-                last_update = datetime.fromtimestamp(simulator.last_tick_time).strftime("%H:%M:%S.%f")[:-3]
-                window["-LAST_UPDATE-"].update(last_update)
-                window["-STATUS-"].update("Connected", text_color="green")
-            
-            results = simulator.get_simulation_results()
-            
-            window["-SLIPPAGE-"].update(f"{results['slippage_pct']:.4f}%")
-            window["-FEES-"].update(f"{results['fee_pct']:.4f}%")
-            window["-MARKET_IMPACT-"].update(f"{results['market_impact_pct']:.4f}%")
-            window["-NET_COST-"].update(f"{results['net_cost_pct']:.4f}%")
-            window["-MAKER-"].update(f"{results['maker_pct']:.2f}%")
-            window["-TAKER-"].update(f"{results['taker_pct']:.2f}%")
-            
-            window["-AVG_LATENCY-"].update(f"{results['avg_latency']:.2f}")
-            window["-MAX_LATENCY-"].update(f"{results['max_latency']:.2f}")
-            window["-MIN_LATENCY-"].update(f"{results['min_latency']:.2f}")
-            
+
+                updates["-BEST_BID-"] = f"{best_bid:.2f}"
+                updates["-BEST_ASK-"] = f"{best_ask:.2f}"
+                updates["-SPREAD-"] = f"{spread_pct:.4f}%"
+                updates["-CALC_VOLATILITY-"] = f"{simulator.volatility * 100:.4f}%"
+
+                # Map the monotonic tick stamp back to wall-clock time for display
+                tick_age_s = (time.monotonic_ns() - simulator.last_tick_ns) / 1e9
+                updates["-LAST_UPDATE-"] = datetime.fromtimestamp(time.time() - tick_age_s).strftime("%H:%M:%S.%f")[:-3]
+                updates["-STATUS-"] = "Connected"
+
+            # Same book, same parameters, same answer - only recompute
+            # the simulation when a tick (or Apply) has touched the book
+            if simulator.orderbook._dirty:
+                simulator.orderbook._dirty = False
+                results = simulator.get_simulation_results()
+
+                updates["-SLIPPAGE-"] = f"{results['slippage_pct']:.4f}%"
+                updates["-FEES-"] = f"{results['fee_pct']:.4f}%"
+                updates["-MARKET_IMPACT-"] = f"{results['market_impact_pct']:.4f}%"
+                updates["-NET_COST-"] = f"{results['net_cost_pct']:.4f}%"
+                updates["-MAKER-"] = f"{results['maker_pct']:.2f}%"
+                updates["-TAKER-"] = f"{results['taker_pct']:.2f}%"
+
+                updates["-AVG_LATENCY-"] = f"{results['avg_latency']:.2f}"
+                updates["-MAX_LATENCY-"] = f"{results['max_latency']:.2f}"
+                updates["-MIN_LATENCY-"] = f"{results['min_latency']:.2f}"
+
+            changed = False
+            for key, text in updates.items():
+                if last_display.get(key) != text:
+                    last_display[key] = text
+                    if key == "-STATUS-":
+                        widget_refs[key].update(text, text_color="green")
+                    else:
+                        widget_refs[key].update(text)
+                    changed = True
+
+            if changed:
+                window.refresh()
+
         except Exception as e:
             logger.error(f"Error updating UI: {e}")
-        
-        await asyncio.sleep(UPDATE_INTERVAL_MS / 1000)
+
+        # Wake up on the next tick instead of polling blindly; the timeout
+        # keeps connection status and latency stats fresh on a quiet feed
+        try:
+            await asyncio.wait_for(simulator.tick_event.wait(), timeout=UPDATE_INTERVAL_MS / 1000)
+        except asyncio.TimeoutError:
+            pass
+        simulator.tick_event.clear()
 
 
 async def handle_events(window, simulator):
@@ -452,8 +634,11 @@ async def handle_events(window, simulator):
                 
                 simulator.quantity = float(values["-QUANTITY-"])
                 simulator.volatility = float(values["-VOLATILITY-"]) / 100
+                simulator.market_impact_calculator.update_volatility(simulator.volatility)
                 simulator.fee_tier = values["-FEE_TIER-"]
                 simulator.order_type = values["-ORDER_TYPE-"]
+                # New parameters change the results even without a new tick
+                simulator.orderbook._dirty = True
                 
                 if exchange_symbol_changed:
                     if simulator.update_symbol_and_exchange(new_exchange, new_symbol):
@@ -478,7 +663,7 @@ async def handle_events(window, simulator):
             except Exception as e:
                 logger.error(f"Error updating parameters: {e}")
         
-        await asyncio.sleep(0.01)
+        await asyncio.sleep(0.05)
 
 
 async def main():
@@ -516,7 +701,14 @@ def signal_handler(sig, frame):
 if __name__ == "__main__":
     import signal
     signal.signal(signal.SIGINT, signal_handler)
-    
+
+    try:
+        import uvloop
+        uvloop.install()
+        logger.info("Using uvloop event loop")
+    except ImportError:
+        pass  # default selector loop (e.g. on Windows)
+
     try:
         asyncio.run(main())
     except KeyboardInterrupt: